@@ -170,12 +170,12 @@ async function main() {
         await prisma.$executeRawUnsafe(`
           INSERT INTO search_chunks (
             id, document_id, matter_id, org_id, chunk_id,
-            section_path, section_number, text, text_vector, embedding,
+            section_path, section_number, text, embedding,
             chunk_type, level, path, tree_node_id, hash, pipeline_version,
             created_at, updated_at
           ) VALUES (
             gen_random_uuid()::text, $1, $2, $3, $4,
-            $5, $6, $7, to_tsvector('english', $7), ARRAY[]::float8[],
+            $5, $6, $7, ARRAY[]::float8[],
             $8, $9, $10::text[], $11, $12, '1.0.0',
             NOW(), NOW()
           )
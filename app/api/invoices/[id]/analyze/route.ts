@@ -99,6 +99,9 @@ export async function POST(
         riskLevel: analysis.riskLevel,
         status: 'ANALYZED',
         duplicateOfId: analysis.duplicateOf,
+        // Child rows are rewritten below; drop the worker's content hashes
+        lineItemsHash: null,
+        riskFlagsHash: null,
       },
     });
 
@@ -1,6 +1,26 @@
 const { PrismaClient } = require('@prisma/client');
 const fs = require('fs');
 const path = require('path');
+const zlib = require('zlib');
+const { execFileSync } = require('child_process');
+
+// zlib only has zstd from Node 22.15; on Node 20 use the zstd CLI
+function zstdDecompressFile(filePath) {
+  if (typeof zlib.zstdDecompressSync === 'function') {
+    return zlib.zstdDecompressSync(fs.readFileSync(filePath));
+  }
+  return execFileSync('zstd', ['-dc', filePath], { maxBuffer: 1024 * 1024 * 1024 });
+}
+
+// Read a pipeline artifact ({base}_{kind}.json.zst or legacy .json); null if missing
+function readArtifact(dir, baseName, kind) {
+  const zstPath = path.join(dir, `${baseName}_${kind}.json.zst`);
+  if (fs.existsSync(zstPath)) {
+    return JSON.parse(zstdDecompressFile(zstPath).toString('utf8'));
+  }
+  const jsonPath = path.join(dir, `${baseName}_${kind}.json`);
+  return fs.existsSync(jsonPath) ? JSON.parse(fs.readFileSync(jsonPath, 'utf8')) : null;
+}
 
 const prisma = new PrismaClient();
 
@@ -82,19 +102,18 @@ async function fixAll() {
   } else if (!fs.existsSync(uploadsDir)) {
     console.log('  ⚠️  Uploads directory not found');
   } else {
-    const dataFiles = fs.readdirSync(dataDir).filter(f => f.endsWith('_parse.json'));
+    const dataFiles = fs.readdirSync(dataDir).filter(f => /_parse\.json(\.zst)?$/.test(f));
     const uploadFiles = fs.readdirSync(uploadsDir);
     
     let restoredCount = 0;
     
     for (const parseFile of dataFiles) {
-      const baseName = parseFile.replace('_parse.json', '');
-      const treeFile = `${baseName}_tree.json`;
+      const baseName = parseFile.replace(/_parse\.json(\.zst)?$/, '');
       
-      if (!fs.existsSync(path.join(dataDir, treeFile))) continue;
+      const treeData = readArtifact(dataDir, baseName, 'tree');
+      if (!treeData) continue;
       
-      const parseData = JSON.parse(fs.readFileSync(path.join(dataDir, parseFile), 'utf8'));
-      const treeData = JSON.parse(fs.readFileSync(path.join(dataDir, treeFile), 'utf8'));
+      const parseData = readArtifact(dataDir, baseName, 'parse');
       const originalFileName = parseData.file_name || `${baseName}.pdf`;
       
       // Find matching upload file
@@ -0,0 +1,3 @@
+-- AlterTable
+ALTER TABLE "invoices" ADD COLUMN     "line_items_hash" TEXT,
+ADD COLUMN     "risk_flags_hash" TEXT;
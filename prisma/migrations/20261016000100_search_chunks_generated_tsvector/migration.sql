@@ -0,0 +1,8 @@
+-- text_vector becomes a stored generated column: writers send raw text only and
+-- Postgres derives the tsvector. Dropping the column also drops its index.
+ALTER TABLE "search_chunks" DROP COLUMN "text_vector";
+ALTER TABLE "search_chunks" ADD COLUMN "text_vector" tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', "text")) STORED;
+
+-- Recreate as GIN (see 20260203120000_fix_gin_index)
+CREATE INDEX "search_chunks_text_vector_idx" ON "search_chunks" USING GIN("text_vector");
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "document_indexes" ADD COLUMN     "content_hash" TEXT;
@@ -0,0 +1,12 @@
+-- Wake pipeline workers (LISTEN documents_uploaded) when a document is queued
+CREATE OR REPLACE FUNCTION notify_document_uploaded() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('documents_uploaded', NEW.id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER "documents_uploaded_notify"
+AFTER INSERT OR UPDATE OF "status" ON "documents"
+FOR EACH ROW WHEN (NEW."status" = 'UPLOADED')
+EXECUTE FUNCTION notify_document_uploaded();
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""Rebuild the text_vector GIN index on search_chunks after a bulk (re)load"""
+import os
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+db_url = os.getenv('DATABASE_URL').split('?')[0]
+conn = psycopg2.connect(db_url)
+conn.autocommit = True  # REINDEX CONCURRENTLY can't run inside a transaction
+cursor = conn.cursor()
+
+cursor.execute("SET maintenance_work_mem = %s", (os.getenv('SEARCH_BULK_MAINTENANCE_MEM', '512MB'),))
+
+print("Rebuilding search_chunks_text_vector_idx (search stays available)...")
+cursor.execute('REINDEX INDEX CONCURRENTLY "search_chunks_text_vector_idx"')
+print("[SUCCESS] Index rebuilt")
+
+conn.close()
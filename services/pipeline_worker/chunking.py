@@ -11,6 +11,11 @@ from datetime import datetime
 
 from logging_utils import StructuredLogHandler, PipelineStep
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 @dataclass
 class Chunk:
@@ -164,8 +169,11 @@ class ChunkExtractor:
         return None
     
     def compute_chunk_hash(self, text: str) -> str:
-        """Compute hash for chunk content versioning."""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+        """Compute hash for chunk content versioning (16 hex chars, not cryptographic)."""
+        data = text.encode('utf-8')
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(data)
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
     
     def normalize_term(self, term: str, language: str) -> str:
         """Normalize Dutch term to English equivalent if applicable."""
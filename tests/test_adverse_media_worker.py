@@ -0,0 +1,110 @@
+"""Queue handling in workers/adverse_media_worker.py against an in-memory Redis"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+for module in ('asyncpg', 'aiohttp', 'httpx', 'openai', 'lupa'):
+    pytest.importorskip(module)
+try:
+    import aioredis  # noqa: F401
+except (ImportError, TypeError) as e:  # aioredis 2.0.1 fails to import on Python 3.11+
+    pytest.skip(f"aioredis unavailable: {e}", allow_module_level=True)
+fakeredis = pytest.importorskip('fakeredis')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'workers'))
+import adverse_media_worker as worker  # noqa: E402
+
+JOB = '{"checkId": "check-1", "companies": []}'
+
+
+class FailingPool:
+    """db_pool whose 'processing' status update fails; records the error updates"""
+
+    def __init__(self):
+        self.error_updates = 0
+
+    async def execute(self, query, *args):
+        if "status = 'error'" in query:
+            self.error_updates += 1
+            return
+        raise ConnectionError('database unavailable')
+
+
+async def _claim(redis_client, scripts):
+    jobs = await scripts['claim'](
+        keys=[worker.QUEUE_KEY, worker.PROCESSING_KEY, worker.CLAIMED_AT_KEY],
+        args=[1, 0],
+    )
+    assert jobs == [JOB]
+    return jobs[0]
+
+
+def test_failed_check_is_requeued_then_moved_to_failed_list():
+    async def scenario():
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        scripts = worker.register_job_scripts(redis_client)
+        pool = FailingPool()
+        await redis_client.lpush(worker.QUEUE_KEY, JOB)
+
+        for attempt in range(1, worker.ADVERSE_MEDIA_MAX_ATTEMPTS):
+            await worker.run_job(redis_client, pool, scripts, await _claim(redis_client, scripts))
+            assert await redis_client.lrange(worker.QUEUE_KEY, 0, -1) == [JOB]
+            assert await redis_client.hget(worker.ATTEMPTS_KEY, JOB) == str(attempt)
+
+        await worker.run_job(redis_client, pool, scripts, await _claim(redis_client, scripts))
+        assert await redis_client.lrange(worker.FAILED_KEY, 0, -1) == [JOB]
+        assert await redis_client.llen(worker.QUEUE_KEY) == 0
+        assert await redis_client.llen(worker.PROCESSING_KEY) == 0
+        assert not await redis_client.hexists(worker.ATTEMPTS_KEY, JOB)
+        assert not await redis_client.hexists(worker.CLAIMED_AT_KEY, JOB)
+        assert pool.error_updates == worker.ADVERSE_MEDIA_MAX_ATTEMPTS
+
+    asyncio.run(scenario())
+
+
+def test_malformed_job_goes_straight_to_failed_list():
+    async def scenario():
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        scripts = worker.register_job_scripts(redis_client)
+        await redis_client.lpush(worker.PROCESSING_KEY, 'not json')
+
+        await worker.run_job(redis_client, FailingPool(), scripts, 'not json')
+        assert await redis_client.lrange(worker.FAILED_KEY, 0, -1) == ['not json']
+        assert await redis_client.llen(worker.PROCESSING_KEY) == 0
+
+    asyncio.run(scenario())
+
+
+def test_running_job_heartbeat_keeps_reaper_away(monkeypatch):
+    async def slow_check(redis_client, db_pool, check_data):
+        await asyncio.sleep(0.3)
+
+    async def scenario():
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        scripts = worker.register_job_scripts(redis_client)
+        await redis_client.lpush(worker.QUEUE_KEY, JOB)
+        job = await _claim(redis_client, scripts)  # claimed at t=0, long past any lease
+        stale = '{"checkId": "orphan", "companies": []}'
+        await redis_client.lpush(worker.PROCESSING_KEY, stale)
+        await redis_client.hset(worker.CLAIMED_AT_KEY, stale, 0)
+
+        running = asyncio.create_task(worker.run_job(redis_client, None, scripts, job))
+        await asyncio.sleep(0.15)
+        now = int(time.time())
+        reaped = await scripts['reap'](
+            keys=[worker.QUEUE_KEY, worker.PROCESSING_KEY, worker.CLAIMED_AT_KEY],
+            args=[now - worker.ADVERSE_MEDIA_LEASE_SECONDS, now],
+        )
+        assert reaped == 1
+        assert await redis_client.lrange(worker.QUEUE_KEY, 0, -1) == [stale]
+
+        await running
+        assert await redis_client.llen(worker.PROCESSING_KEY) == 0
+        assert not await redis_client.hexists(worker.CLAIMED_AT_KEY, JOB)
+
+    monkeypatch.setattr(worker, 'process_check', slow_check)
+    monkeypatch.setattr(worker, 'ADVERSE_MEDIA_HEARTBEAT_INTERVAL', 0.05)
+    asyncio.run(scenario())
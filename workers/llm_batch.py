@@ -0,0 +1,156 @@
+"""
+Batch API helpers for non-interactive Kimi/OpenAI-compatible chat calls.
+
+Requests are uploaded as one JSONL file to /v1/batches and polled until the
+output file is ready. BatchCollector buffers requests from worker threads and
+flushes them as one batch when enough are pending; a lone request that waits
+too long is sent through the regular (sync) endpoint instead, as is every
+request of a batch that isn't done within batch_timeout seconds.
+"""
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+CHAT_ENDPOINT = "/v1/chat/completions"
+TERMINAL_FAILURES = ('failed', 'expired', 'cancelled')
+
+
+def submit_batch(client, requests: List[Dict], endpoint: str = CHAT_ENDPOINT) -> str:
+    """Upload requests ({custom_id, body}) as JSONL and create a batch; returns the batch id"""
+    lines = [
+        json.dumps({"custom_id": r["custom_id"], "method": "POST", "url": endpoint, "body": r["body"]},
+                   ensure_ascii=False)
+        for r in requests
+    ]
+    upload = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint=endpoint,
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def poll_batch(client, batch_id: str, interval: float = 30, timeout: Optional[float] = None) -> Dict[str, Dict]:
+    """Wait for a batch to finish; returns {custom_id: {"body": ...} or {"error": ...}}"""
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status == 'completed':
+            break
+        if batch.status in TERMINAL_FAILURES:
+            raise RuntimeError(f"Batch {batch_id} {batch.status}")
+        if deadline and time.monotonic() > deadline:
+            raise TimeoutError(f"Batch {batch_id} still {batch.status} after {timeout}s")
+        time.sleep(interval)
+
+    results: Dict[str, Dict] = {}
+    for file_id in (batch.output_file_id, getattr(batch, 'error_file_id', None)):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get('response') or {}
+            if item.get('error') or response.get('status_code', 200) >= 400:
+                results[item['custom_id']] = {'error': item.get('error') or response.get('body')}
+            else:
+                results[item['custom_id']] = {'body': response.get('body')}
+    return results
+
+
+class BatchCollector:
+    """Buffers chat requests from worker threads and flushes them as Batch API jobs"""
+
+    def __init__(self, client, sync_fn: Callable[[Dict], Dict], min_size: int = 5,
+                 max_size: int = 100, max_wait: float = 10, poll_interval: float = 30,
+                 batch_timeout: float = 900):
+        self.client = client
+        self.sync_fn = sync_fn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.batch_timeout = batch_timeout
+        self._pending: List[Tuple[str, Dict, Future]] = []
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        threading.Thread(target=self._run, name="llm-batch", daemon=True).start()
+
+    def submit(self, custom_id: str, body: Dict) -> Future:
+        """Queue one chat request body; the Future resolves to the completion dict"""
+        future: Future = Future()
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((custom_id, body, future))
+            full = len(self._pending) >= self.max_size
+        if full:
+            self._wake.set()
+        return future
+
+    def complete(self, custom_id: str, body: Dict, timeout: Optional[float] = None) -> Dict:
+        """Blocking submit(): returns the completion dict or raises (TimeoutError after timeout seconds,
+        by default long enough for a timed-out batch plus its sync fallback)"""
+        if timeout is None:
+            timeout = self.max_wait + self.poll_interval + 2 * self.batch_timeout
+        return self.submit(custom_id, body).result(timeout=timeout)
+
+    def _run(self):
+        """Flush on size or age; small stale buffers go through the sync endpoint"""
+        while True:
+            self._wake.wait(1)
+            self._wake.clear()
+            with self._lock:
+                if not self._pending:
+                    continue
+                aged = time.monotonic() - self._oldest >= self.max_wait
+                if len(self._pending) < self.max_size and not aged:
+                    continue
+                items, self._pending = self._pending[:self.max_size], self._pending[self.max_size:]
+                self._oldest = time.monotonic()
+            if len(items) >= self.min_size:
+                threading.Thread(target=self._run_batch, args=(items,), name="llm-batch-poll", daemon=True).start()
+            else:
+                threading.Thread(target=self._run_sync, args=(items,), name="llm-batch-sync", daemon=True).start()
+
+    def _run_sync(self, items: List[Tuple[str, Dict, Future]]):
+        """Send requests one by one through the regular endpoint"""
+        for _, body, future in items:
+            try:
+                future.set_result(self.sync_fn(body))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _run_batch(self, items: List[Tuple[str, Dict, Future]]):
+        """Submit one batch, wait for it and resolve each request's Future"""
+        batch_id = None
+        try:
+            batch_id = submit_batch(self.client, [{'custom_id': cid, 'body': body} for cid, body, _ in items])
+            print(f"[LLM-BATCH] Submitted {len(items)} requests as {batch_id}")
+            results = poll_batch(self.client, batch_id, interval=self.poll_interval, timeout=self.batch_timeout)
+        except TimeoutError as e:
+            print(f"[LLM-BATCH] {e}, cancelling and falling back to sync calls")
+            try:
+                self.client.batches.cancel(batch_id)
+            except Exception:
+                pass
+            self._run_sync(items)
+            return
+        except Exception as e:
+            print(f"[LLM-BATCH] Batch failed ({e}), falling back to sync calls")
+            self._run_sync(items)
+            return
+        for cid, _, future in items:
+            result = results.get(cid)
+            if result and result.get('body'):
+                future.set_result(result['body'])
+            else:
+                future.set_exception(RuntimeError(f"Batch request {cid} failed: {(result or {}).get('error')}"))
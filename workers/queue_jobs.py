@@ -23,20 +23,41 @@ if DATABASE_URL and '?' in DATABASE_URL:
 r = redis.from_url(REDIS_URL, decode_responses=True)
 conn = psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
 
-# Clear old queue
-r.delete('bull:document-processing:wait')
-r.delete('bull:document-processing:active')
-r.delete('bull:document-processing:completed')
-r.delete('bull:document-processing:failed')
+# Clear old queue (one DEL for all four lists)
+r.delete(
+    'bull:document-processing:wait',
+    'bull:document-processing:active',
+    'bull:document-processing:completed',
+    'bull:document-processing:failed',
+)
 print('[QUEUE] Cleared old queue')
 
-# Get documents
-cursor = conn.cursor()
+# One directory listing per storage directory instead of a stat per document
+dir_cache = {}
+
+def file_exists(path: str) -> bool:
+    """Whether path exists, answered from a cached listing of its directory"""
+    directory, name = os.path.split(path)
+    names = dir_cache.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        dir_cache[directory] = names
+    return name in names
+
+# Get documents - named (server-side) cursor streams rows in batches
+# instead of loading every pending document into memory
+cursor = conn.cursor(name='queue_docs_stream')
+cursor.itersize = 1000
 cursor.execute("SELECT id, name, file_name, storage_key, organization_id FROM documents WHERE status = 'UPLOADED'")
-docs = cursor.fetchall()
 
+# Job HSET/LPUSH commands are pipelined and flushed once per cursor batch
+pipe = r.pipeline(transaction=False)
 job_id = 1
-for doc in docs:
+for doc in cursor:
     doc_id = doc['id']
     file_path = doc['storage_key']
     
@@ -45,7 +66,7 @@ for doc in docs:
         file_path = str(project_root / file_path)
     
     # Check file exists
-    if not Path(file_path).exists():
+    if not file_exists(file_path):
         print(f'[MISSING] {doc_id}: {file_path}')
         continue
     
@@ -73,7 +94,7 @@ for doc in docs:
     
     # Save job hash
     job_key = f'bull:document-processing:{job_id}'
-    r.hset(job_key, mapping={
+    pipe.hset(job_key, mapping={
         'id': job_id,
         'name': 'process-document',
         'data': json.dumps(job_data['data']),
@@ -84,13 +105,16 @@ for doc in docs:
     })
     
     # Add to queue
-    r.lpush('bull:document-processing:wait', job_id)
+    pipe.lpush('bull:document-processing:wait', job_id)
     
     print(f'[QUEUED] Job {job_id}: {doc["file_name"]}')
+    if job_id % cursor.itersize == 0:
+        pipe.execute()
     job_id += 1
 
 # Update ID counter
-r.set('bull:document-processing:id', job_id - 1)
+pipe.set('bull:document-processing:id', job_id - 1)
+pipe.execute()
 
 cursor.close()
 conn.close()